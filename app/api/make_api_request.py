@@ -9,10 +9,17 @@ Functions:
     make_api_request(url, api_key: str = None): Sends a GET request to the specified URL
     and returns the response in JSON format if the request is successful.
     Handles timeouts and request exceptions.
+    make_async_api_request(url, api_key: str = None): The non-blocking counterpart of
+    `make_api_request`, sent through a shared HTTP/2 keep-alive client.
 """
 
+import httpx
 import requests
 
+async_client = httpx.AsyncClient(
+    http2=True, timeout=10, limits=httpx.Limits(max_keepalive_connections=10)
+)
+
 
 def make_api_request(url, api_key: str = None):
     """
@@ -51,6 +58,37 @@ def make_api_request(url, api_key: str = None):
     return None
 
 
+async def make_async_api_request(url, api_key: str = None):
+    """
+    Send a GET request without blocking the event loop.
+
+    Behaves like `make_api_request` but awaits the response on the shared
+    `async_client`, reusing its pooled keep-alive connections.
+
+    Args:
+        url (str): The API endpoint URL to send the GET request to.
+        api_key (str, optional): The API key to authenticate the request. Defaults to None.
+
+    Returns:
+        dict or None: The response data in JSON format if the request is successful,
+                      or None if the request fails or encounters an error.
+    """
+    try:
+        params = {}
+        if api_key:
+            params["api_key"] = api_key
+
+        response = await async_client.get(url, params=params)
+        if response.status_code == 200:
+            return response.json()
+    except httpx.TimeoutException:
+        print("The request timed out.")
+    except httpx.HTTPError as e:
+        print(f"An error occurred: {e}")
+
+    return None
+
+
 def parse_mission_data(api_response):
     """
     Parse API response and ensure all required fields are present.
@@ -4,10 +4,41 @@ This module provides functions for interacting with the SpaceX Launch API.
 It includes functionality to fetch information about SpaceX launches using
 the public SpaceX data API. The API returns a list of launches, including
 details like launch dates, mission names, and more.
+
+The latest response is kept in `spacex_data`, which is empty until
+`fetch_spacex_data` has been awaited (the app does this on startup).
+Alongside it, `spacex_json` holds the serialized launches and `spacex_etag`
+a content hash of them, both computed once per refresh for HTTP caching.
 """
 
-from .make_api_request import make_api_request
+import hashlib
+import json
+
+from .make_api_request import make_async_api_request
 
 SPACEX_API_URL = "https://api.spacexdata.com/v4/launches"
 
-spacex_data = make_api_request(SPACEX_API_URL)
+# pylint: disable=invalid-name
+spacex_data = None
+spacex_json = None
+spacex_etag = None
+# pylint: enable=invalid-name
+
+
+async def fetch_spacex_data():
+    """
+    Fetch the SpaceX launches and cache them in `spacex_data`.
+
+    A failed request leaves the previously fetched launches in place.
+
+    Returns:
+        list or None: The launches from the API, or None if the request failed.
+    """
+    global spacex_data, spacex_json, spacex_etag  # pylint: disable=global-statement
+    launches = await make_async_api_request(SPACEX_API_URL)
+    if launches:
+        body = json.dumps(launches, sort_keys=True).encode()
+        spacex_data = launches
+        spacex_json = body
+        spacex_etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return launches
@@ -6,78 +6,238 @@ in the database using SQLAlchemy ORM. It provides basic CRUD operations
 for interacting with mission data.
 
 Functions:
+    - get_filtered_missions: Retrieves a filtered page of missions using keyset pagination.
     - create_mission: Creates a new mission in the database.
+    - bulk_upsert_missions: Inserts or updates many missions in a single statement.
     - get_missions: Retrieves a list of missions with pagination support.
     - get_mission_by_name: Retrieves a mission by its name.
+    - get_mission_status_counts: Counts missions in total and per status.
+    - get_mission_counters: Reads the mission counts kept in Redis.
+    - refresh_mission_counters: Rebuilds the Redis mission counts from the database.
+    - claim_job_run: Claims the next run of a scheduled job across worker processes.
 """
 
-from sqlalchemy.orm import Session
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import redis
+from sqlalchemy import func, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, load_only, raiseload
 from . import models, schemas
+from .database import redis_client
+
+# Redis keys holding the mission counts shown on the home page
+MISSION_COUNTER_KEYS = {
+    "total": "missions:total",
+    "completed": "missions:completed",
+    "ongoing": "missions:ongoing",
+}
+# How often a counter refresh is retried when concurrent writes interrupt it
+COUNTER_REFRESH_ATTEMPTS = 5
+
+
+def encode_cursor(launch_date, mission_id):
+    """
+    Encodes the position of a mission into an opaque pagination cursor.
+
+    Args:
+        launch_date (datetime or None): The launch date of the last mission on the page.
+        mission_id (int): The ID of the last mission on the page.
+
+    Returns:
+        str: A URL-safe base64 cursor.
+    """
+    payload = [launch_date.isoformat() if launch_date else None, mission_id]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a pagination cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor returned with a previous page.
+
+    Returns:
+        tuple: The (launch_date, id) of the last mission on the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        launch_date, mission_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if launch_date is not None:
+            launch_date = datetime.fromisoformat(launch_date)
+        return launch_date, int(mission_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _name_matches(db, keyword):
+    """
+    Builds a case-insensitive substring filter on the mission name.
+
+    PostgreSQL gets an ILIKE so the trigram GIN index on name can serve it;
+    other databases (SQLite in local development) fall back to LIKE.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return models.Mission.name.ilike(f"%{escaped}%", escape="\\")
+    return models.Mission.name.contains(keyword, autoescape=True)
+
+
+def _insert(db):
+    """
+    Returns the dialect-specific insert construct supporting ON CONFLICT clauses.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
+def _ordered(query):
+    """
+    Orders missions by (launch_date, id) with undated missions first, matching
+    the ix_missions_launch_date_id index on every supported database.
+    """
+    return query.order_by(
+        models.Mission.launch_date.asc().nulls_first(), models.Mission.id.asc()
+    )
+
+
+def _fetch_after_cursor(query, cursor, limit):
+    """
+    Fetches up to `limit` missions that sort after the given cursor.
+
+    Each query is a range seek on ix_missions_launch_date_id. Missions without a
+    launch date sort first, so a cursor pointing at one of them reads the rest of
+    the undated missions and, if the page isn't full yet, tops it up with the
+    earliest dated ones.
+    """
+    last_date, last_id = decode_cursor(cursor)
+    if last_date is not None:
+        return (
+            _ordered(
+                query.filter(
+                    tuple_(models.Mission.launch_date, models.Mission.id)
+                    > (last_date, last_id)
+                )
+            )
+            .limit(limit)
+            .all()
+        )
+
+    missions = (
+        _ordered(
+            query.filter(
+                models.Mission.launch_date.is_(None), models.Mission.id > last_id
+            )
+        )
+        .limit(limit)
+        .all()
+    )
+    if len(missions) < limit:
+        missions += (
+            _ordered(query.filter(models.Mission.launch_date.isnot(None)))
+            .limit(limit - len(missions))
+            .all()
+        )
+    return missions
 
 
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-positional-arguments
 def get_filtered_missions(
-    db, page, size, start_date, end_date, keyword, sort_by=None, sort_order="asc"
+    db, size, start_date, end_date, keyword, cursor=None, page=None
 ):
     """
-    Retrieves a filtered list of missions from the database.
+    Retrieves a filtered page of missions from the database.
+
+    Missions are ordered by (launch_date, id) and paginated with a keyset
+    cursor, so fetching a deep page is an index seek instead of a scan over
+    every skipped row. Only the columns in `models.Mission.LIST_COLUMNS` are
+    loaded.
 
     Args:
         db: The database session.
-        page (int): The page number for pagination.
         size (int): The number of missions to return per page.
         start_date (datetime): The earliest launch date to filter missions.
         end_date (datetime): The latest launch date to filter missions.
         keyword (str): A keyword to filter mission names.
-        sort_by (str, optional): The column name to sort by.
-        sort_order (str, optional): The order of sorting ('asc' or 'desc'). Defaults to 'asc'.
+        cursor (str, optional): The `next_cursor` returned with the previous page.
+        page (int, optional): Deprecated OFFSET-based page number, only used
+            when no cursor is given.
 
     Returns:
-        List[models.Mission]: A list of missions matching the specified filters and pagination.
+        dict: The missions under "data", the cursor for the following page under
+        "next_cursor" and whether more missions exist under "has_more".
+
+    Raises:
+        ValueError: If the cursor is malformed or size is not positive.
     """
-    query = db.query(models.Mission)
+    if size < 1:
+        raise ValueError("Page size must be at least 1.")
+
+    # Listings never traverse relationships or unlisted columns; fail loudly
+    # instead of issuing N+1 loads
+    list_columns = [getattr(models.Mission, c) for c in models.Mission.LIST_COLUMNS]
+    query = db.query(models.Mission).options(
+        load_only(*list_columns, raiseload=True), raiseload("*")
+    )
     if start_date:
         query = query.filter(models.Mission.launch_date >= start_date)
     if end_date:
         query = query.filter(models.Mission.launch_date <= end_date)
     if keyword:
-        query = query.filter(models.Mission.name.contains(keyword))
-    if sort_by:
-        sort_column = getattr(models.Mission, sort_by, None)
-        if sort_column:
-            query = query.order_by(
-                sort_column.asc() if sort_order == "asc" else sort_column.desc()
-            )
-    return query.offset((page - 1) * size).limit(size).all()
+        query = query.filter(_name_matches(db, keyword))
+    # Fetch one extra row to know whether another page follows
+    if cursor:
+        missions = _fetch_after_cursor(query, cursor, size + 1)
+    else:
+        query = _ordered(query)
+        if page:
+            query = query.offset((page - 1) * size)
+        missions = query.limit(size + 1).all()
+    has_more = len(missions) > size
+    missions = missions[:size]
+    next_cursor = None
+    if has_more:
+        last = missions[-1]
+        next_cursor = encode_cursor(last.launch_date, last.id)
+    return {"data": missions, "next_cursor": next_cursor, "has_more": has_more}
 
 
-def create_or_update_mission(db: Session, mission_data: dict):
+def bulk_upsert_missions(db: Session, missions: list[dict]):
     """
-    Creates a new mission or updates an existing one in the database.
+    Inserts or updates many missions with a single INSERT ... ON CONFLICT statement.
+
+    The statement is built with SQLAlchemy Core and executed once for the whole
+    batch, bypassing the ORM unit of work used by `create_mission`.
+
+    Missions are matched on their unique name; existing rows get every other
+    supplied column overwritten. If the same name appears more than once, the
+    last entry wins.
 
     Args:
         db (Session): The database session to use for the operation.
-        mission_data (dict): A dictionary containing mission data.
-
-    Returns:
-        models.Mission: The created or updated mission object.
+        missions (list[dict]): Mission data dictionaries sharing the same keys.
     """
-    existing_mission = (
-        db.query(models.Mission)
-        .filter(models.Mission.name == mission_data["name"])
-        .first()
-    )
-    if existing_mission:
-        # Update existing mission
-        for key, value in mission_data.items():
-            setattr(existing_mission, key, value)
-        db.commit()
-        db.refresh(existing_mission)
-        return existing_mission
+    missions = list({mission["name"]: mission for mission in missions}.values())
+    if not missions:
+        return
 
-    # Create new mission
-    return create_mission(db, schemas.MissionCreate(**mission_data))
+    # Core insert on the table: no ORM instances, identity map or flush per row
+    stmt = _insert(db)(models.Mission.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[models.Mission.name],
+        set_={key: stmt.excluded[key] for key in missions[0] if key != "name"},
+    )
+    db.execute(stmt, missions)
+    db.commit()
+    # Upserts can move missions between statuses, so recount rather than diff
+    refresh_mission_counters(db)
 
 
 def create_mission(db: Session, mission: schemas.MissionCreate):
@@ -95,6 +255,7 @@ def create_mission(db: Session, mission: schemas.MissionCreate):
     db.add(db_mission)
     db.commit()
     db.refresh(db_mission)
+    _invalidate_mission_counters()
     return db_mission
 
 
@@ -110,7 +271,9 @@ def get_missions(db: Session, skip: int = 0, limit: int = 10):
     Returns:
         list: A list of mission objects.
     """
-    return db.query(models.Mission).offset(skip).limit(limit).all()
+    return (
+        db.query(models.Mission).options(raiseload("*")).offset(skip).limit(limit).all()
+    )
 
 
 def get_mission_by_name(db: Session, name: str):
@@ -125,3 +288,165 @@ def get_mission_by_name(db: Session, name: str):
         models.Mission or None: The mission object if found, otherwise None.
     """
     return db.query(models.Mission).filter(models.Mission.name == name).first()
+
+
+def get_mission_status_counts(db: Session):
+    """
+    Counts missions in total and by status with a single GROUP BY query.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        dict: The "total", "completed" and "ongoing" mission counts.
+    """
+    counts = {"total": 0, "completed": 0, "ongoing": 0}
+    rows = (
+        db.query(models.Mission.status, func.count(models.Mission.id))
+        .group_by(models.Mission.status)
+        .all()
+    )
+    for status, count in rows:
+        counts["total"] += count
+        key = (status or "").lower()
+        if key in counts and key != "total":
+            counts[key] += count
+    return counts
+
+
+def get_mission_counters(db: Session):
+    """
+    Reads the mission counts from Redis, rebuilding them from the database if missing.
+
+    Args:
+        db (Session): The database session used to rebuild missing counters.
+
+    Returns:
+        dict or None: The "total", "completed" and "ongoing" mission counts, or
+        None if Redis is not configured or unavailable.
+    """
+    if redis_client is None:
+        return None
+    try:
+        values = redis_client.mget(list(MISSION_COUNTER_KEYS.values()))
+        if None not in values:
+            return {key: int(value) for key, value in zip(MISSION_COUNTER_KEYS, values)}
+        return refresh_mission_counters(db)
+    except redis.RedisError as e:
+        print(f"Could not read mission counters from Redis: {e}")
+        return None
+
+
+def refresh_mission_counters(db: Session):
+    """
+    Recomputes the mission counts with one GROUP BY query and stores them in Redis.
+
+    The counter keys are WATCHed across the recount and written in a MULTI/EXEC
+    transaction. A concurrent `create_mission` deleting the keys in between
+    aborts the write, and the recount is retried so it includes the new mission.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        dict or None: The stored counts, or None if Redis is not configured,
+        unavailable, or the counters kept changing during every attempt.
+    """
+    if redis_client is None:
+        return None
+    try:
+        with redis_client.pipeline(transaction=True) as pipe:
+            for _ in range(COUNTER_REFRESH_ATTEMPTS):
+                try:
+                    pipe.watch(*MISSION_COUNTER_KEYS.values())
+                    counts = get_mission_status_counts(db)
+                    pipe.multi()
+                    pipe.mset(
+                        {
+                            MISSION_COUNTER_KEYS[key]: count
+                            for key, count in counts.items()
+                        }
+                    )
+                    pipe.execute()
+                    return counts
+                except redis.WatchError:
+                    continue
+        print("Mission counters kept changing in Redis, refresh skipped.")
+    except redis.RedisError as e:
+        print(f"Could not store mission counters in Redis: {e}")
+    return None
+
+
+def _invalidate_mission_counters():
+    """
+    Drops the Redis mission counters so the next read rebuilds them from the database.
+
+    Deleting rather than incrementing keeps `refresh_mission_counters` the only
+    writer of the counts. The DEL also touches the WATCHed keys, so a refresh
+    whose recount missed the new mission aborts and counts again.
+    """
+    if redis_client is None:
+        return
+    try:
+        redis_client.delete(*MISSION_COUNTER_KEYS.values())
+    except redis.RedisError as e:
+        print(f"Could not reset mission counters in Redis: {e}")
+
+
+def claim_job_run(db: Session, name: str, min_interval: timedelta):
+    """
+    Claims a run of a scheduled job unless one was claimed within `min_interval`.
+
+    The claim is a single conditional UPDATE (or an INSERT for the job's first
+    run), so when several worker processes try at once exactly one succeeds.
+
+    Args:
+        db (Session): The database session.
+        name (str): The name of the job.
+        min_interval (timedelta): The minimum time between two runs of the job.
+
+    Returns:
+        datetime or None: The time of the claim if this caller claimed the run
+        and should perform the job, otherwise None.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    table = models.JobRun.__table__
+    claimed = db.execute(
+        update(table)
+        .where(table.c.name == name, table.c.last_run_at <= now - min_interval)
+        .values(last_run_at=now)
+    ).rowcount
+    if not claimed:
+        claimed = db.execute(
+            _insert(db)(table)
+            .values(name=name, last_run_at=now)
+            .on_conflict_do_nothing(index_elements=[table.c.name])
+        ).rowcount
+    db.commit()
+    return now if claimed == 1 else None
+
+
+def release_job_run(
+    db: Session, name: str, claimed_at: datetime, min_interval: timedelta
+):
+    """
+    Gives back a claim from `claim_job_run` after the job failed.
+
+    The job's last run is moved back by `min_interval`, so the next attempt by
+    any worker can claim it instead of waiting out the interval. Nothing changes
+    if the job has been claimed again since.
+
+    Args:
+        db (Session): The database session.
+        name (str): The name of the job.
+        claimed_at (datetime): The time returned by `claim_job_run`.
+        min_interval (timedelta): The interval the claim was made with.
+    """
+    db.rollback()
+    table = models.JobRun.__table__
+    db.execute(
+        update(table)
+        .where(table.c.name == name, table.c.last_run_at == claimed_at)
+        .values(last_run_at=claimed_at - min_interval)
+    )
+    db.commit()
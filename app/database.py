@@ -7,19 +7,52 @@ a session maker for creating database sessions and an engine for database
 interaction.
 
 Configuration:
-    - DATABASE_URL: The URL for connecting to the database (SQLite in this case).
-    - engine: The SQLAlchemy engine used for connecting to the database.
+    - DATABASE_URL: The URL for connecting to the database, read from the
+      DATABASE_URL environment variable and defaulting to a local SQLite file.
+    - engine: The SQLAlchemy engine used for connecting to the database. It keeps
+      a pool of up to POOL_SIZE + MAX_OVERFLOW connections per process, so
+      running `uvicorn --workers N` opens up to N times that many connections.
     - SessionLocal: A session maker used to create session instances for database operations.
     - Base: The base class used for defining ORM models.
+    - REDIS_URL: Optional URL of a Redis server, read from the REDIS_URL environment
+      variable. When set, `redis_client` shares a connection pool to it; otherwise
+      `redis_client` is None and Redis-backed features are skipped.
 """
 
+import os
+
+import redis
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./missions.db")
+
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
 
-DATABASE_URL = "sqlite:///./missions.db"
+connect_args = {}
+if DATABASE_URL.startswith("sqlite"):
+    connect_args["check_same_thread"] = False
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_engine(
+    DATABASE_URL,
+    connect_args=connect_args,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+redis_client = None
+if REDIS_URL:
+    redis_client = redis.Redis(
+        connection_pool=redis.ConnectionPool.from_url(
+            REDIS_URL, max_connections=POOL_SIZE + MAX_OVERFLOW, decode_responses=True
+        )
+    )
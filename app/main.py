@@ -13,27 +13,39 @@ The app initializes the database tables on startup and provides an HTTP interfac
 for users to interact with the system.
 """
 
-import random
+import asyncio
+import itertools
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from fastapi import (
     FastAPI,
     Depends,
     HTTPException,
     BackgroundTasks,
+    Query,
     Request,
 )
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
-from fastapi_utils.tasks import repeat_every
+from pydantic import TypeAdapter, ValidationError
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from . import crud, schemas, database
 from .api import spacex, make_api_request
 
-
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+scheduler = AsyncIOScheduler()
 # Setup templates
 templates = Jinja2Templates(directory="app/templates")
+if os.environ.get("ENV") == "prod":
+    # Templates don't change in production; skip the stat() check on every render
+    templates.env.auto_reload = False
 
 
 # Dependency to get database session
@@ -52,57 +64,166 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def db_session():
+    """
+    Context manager providing a database session outside of request handling.
+
+    The session is rolled back if the block raises and always closed on exit,
+    returning its connection to the pool straight away.
+
+    Yields:
+        Session: SQLAlchemy session object to interact with the database.
+    """
+    db = database.SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 async def load_initial_data():
     """
     FastAPI startup event handler.
     This function creates all tables in the database upon server startup.
     """
-    db = next(get_db())
     try:
-        update_spacex_data(db)
+        await refresh_spacex_missions()
     except ConnectionError as ce:
         print(f"Connection error occured loading SpaceX data: {ce}")
     except ValueError as ve:
         print(f"Value Error loading initial SpaceX data: {ve}")
 
 
+# Every worker schedules the SpaceX update, but only one of them runs it per
+# interval. Runs are jittered by up to SPACEX_UPDATE_JITTER_SECONDS, so a claim
+# is accepted once that much less than a full interval has passed.
+SPACEX_UPDATE_JOB = "spacex_update"
+SPACEX_UPDATE_INTERVAL = timedelta(hours=1)
+SPACEX_UPDATE_JITTER_SECONDS = 300
+SPACEX_UPDATE_MIN_GAP = SPACEX_UPDATE_INTERVAL - timedelta(
+    seconds=SPACEX_UPDATE_JITTER_SECONDS
+)
+
+
 @app.on_event("startup")
-@repeat_every(seconds=3600)  # Runs every hour
-def periodic_mission_update() -> None:
+async def start_scheduler():
     """
-    Periodically updates SpaceX mission data every hour.
+    FastAPI startup event handler.
+    Schedules the hourly SpaceX mission update, jittered by up to five minutes so
+    workers started together don't all refresh at the same moment.
+    """
+    scheduler.add_job(
+        refresh_spacex_missions,
+        trigger="interval",
+        seconds=SPACEX_UPDATE_INTERVAL.total_seconds(),
+        jitter=SPACEX_UPDATE_JITTER_SECONDS,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.start()
+
 
-    This function is triggered on the application startup and runs at specified intervals
-    to fetch and update mission data from the SpaceX API.
+@app.on_event("shutdown")
+async def shutdown_background_services():
     """
-    db = next(get_db())
-    update_spacex_data(db)
+    FastAPI shutdown event handler.
+    Stops the scheduler and closes the shared HTTP client used to call external APIs.
+    """
+    scheduler.shutdown(wait=False)
+    await make_api_request.async_client.aclose()
 
 
-def update_spacex_data(db: Session):
+async def refresh_spacex_missions(claim: bool = True):
+    """
+    Updates SpaceX mission data using a session that lives only for the update.
+
+    Args:
+        claim (bool, optional): Whether the database write must first be claimed
+            so only one worker performs it per interval. Defaults to True.
+    """
+    with db_session() as db:
+        await update_spacex_data(db, claim=claim)
+
+
+# Validates a whole batch of parsed missions in one call into pydantic-core
+_missions_adapter = TypeAdapter(List[schemas.MissionCreate])
+
+
+def validate_missions(missions: list):
+    """
+    Validate parsed mission dictionaries against `schemas.MissionCreate`.
+
+    The batch is validated in one call. If some missions are invalid they are
+    logged and dropped, and the remaining ones are validated again.
+
+    Args:
+        missions (list): Mission data dictionaries.
+
+    Returns:
+        list: The valid missions as dictionaries of the fields they supplied.
+    """
+    try:
+        valid = _missions_adapter.validate_python(missions)
+    except ValidationError as e:
+        invalid = {error["loc"][0] for error in e.errors()}
+        for index in sorted(invalid):
+            print(f"Invalid mission data: {missions[index]}")
+        valid = _missions_adapter.validate_python(
+            [m for index, m in enumerate(missions) if index not in invalid]
+        )
+    return [mission.model_dump(exclude_unset=True) for mission in valid]
+
+
+async def update_spacex_data(db: Session, claim: bool = True):
     """
     Updates SpaceX mission data in the database.
 
     Args:
         db (Session): The database session to use for updating mission data.
-
-    This function retrieves mission data from the SpaceX API, parses it,
-    and creates or updates mission records in the database. Invalid missions
-    are skipped and logged.
+        claim (bool, optional): Whether to skip the upsert unless this worker
+            claims the interval's run. Defaults to True.
+
+    This function fetches mission data from the SpaceX API without blocking the
+    event loop, parses it, and creates or updates all mission records in a single
+    upsert run in a worker thread. Invalid missions are skipped and logged. Every
+    worker refreshes its cached launches, but when claiming, the upsert is skipped
+    if another worker already ran it this interval. If the upsert fails, the claim
+    is released so the next scheduled attempt on any worker retries it.
     """
-    spacex_response = spacex.spacex_data
+    spacex_response = await spacex.fetch_spacex_data()
     if not spacex_response:
         print("No response from SpaceX API.")
         return
 
     spacex_missions = make_api_request.parse_mission_data(spacex_response)
-    for mission in spacex_missions:
-        if not mission.get("name") or not mission.get("status"):
-            print(f"Invalid mission data: {mission}")
-            continue  # Skip invalid missions
-
-        crud.create_or_update_mission(db, mission)
+    valid_missions = validate_missions(spacex_missions)
+
+    claimed_at = None
+    if claim:
+        claimed_at = await asyncio.to_thread(
+            crud.claim_job_run, db, SPACEX_UPDATE_JOB, SPACEX_UPDATE_MIN_GAP
+        )
+        if claimed_at is None:
+            print("SpaceX missions already updated this interval, skipping.")
+            return
+    try:
+        await asyncio.to_thread(crud.bulk_upsert_missions, db, valid_missions)
+    except Exception:
+        if claimed_at is not None:
+            print("SpaceX mission update failed, releasing this interval's run.")
+            await asyncio.to_thread(
+                crud.release_job_run,
+                db,
+                SPACEX_UPDATE_JOB,
+                claimed_at,
+                SPACEX_UPDATE_MIN_GAP,
+            )
+        raise
 
 
 @app.get("/")
@@ -125,6 +246,42 @@ FUN_FACTS = [
     "Space is completely silent because there's no air.",
     "Jupiter's Great Red Spot is a massive storm that has raged for hundreds of years.",
 ]
+_FACT_IDX = itertools.cycle(range(len(FUN_FACTS)))
+
+# Browsers and CDNs may reuse these responses instead of fetching them again.
+# The home page rotates its fun fact per visit, so only the visitor's own
+# browser may keep it, and for no longer than the mission stats may lag.
+INDEX_CACHE_CONTROL = "private, max-age=60"
+SPACEX_LAUNCHES_CACHE_CONTROL = "public, max-age=300"
+
+# Without Redis, mission stats on the home page may lag the database by this long
+STATS_TTL_SECONDS = 60
+_stats_cache = {"counts": {}, "expires_at": 0.0}
+
+
+def get_mission_stats(db: Session):
+    """
+    Return the mission status counts for the home page.
+
+    The counts come from the Redis counters, which every write resets and the
+    next read rebuilds. Without Redis they are recomputed from the database at
+    most once per TTL.
+
+    Args:
+        db (Session): The database session used when the counts must be recomputed.
+
+    Returns:
+        dict: The "total", "completed" and "ongoing" mission counts.
+    """
+    counters = crud.get_mission_counters(db)
+    if counters is not None:
+        return counters
+
+    now = time.monotonic()
+    if now >= _stats_cache["expires_at"]:
+        _stats_cache["counts"] = crud.get_mission_status_counts(db)
+        _stats_cache["expires_at"] = now + STATS_TTL_SECONDS
+    return _stats_cache["counts"]
 
 
 @app.get("/index", response_class=HTMLResponse)
@@ -132,25 +289,23 @@ def read_home(request: Request):
     """
     Fetch the home page with fun facts and latest space news
     """
-    db = next(get_db())
     # Fetch mission stats
-    missions = crud.get_missions(db, limit=100)
-    total_missions = len(missions)
-    completed_missions = len([m for m in missions if m.status.lower() == "completed"])
-    ongoing_missions = len([m for m in missions if m.status.lower() == "ongoing"])
+    with db_session() as db:
+        stats = get_mission_stats(db)
 
-    # Random fact
-    fun_fact = random.choice(FUN_FACTS)
+    # Rotate through the facts on each visit
+    fun_fact = FUN_FACTS[next(_FACT_IDX)]
 
     return templates.TemplateResponse(
         "index.html",
         {
             "request": request,
-            "total_missions": total_missions,
-            "completed_missions": completed_missions,
-            "ongoing_missions": ongoing_missions,
+            "total_missions": stats["total"],
+            "completed_missions": stats["completed"],
+            "ongoing_missions": stats["ongoing"],
             "fun_fact": fun_fact,
         },
+        headers={"Cache-Control": INDEX_CACHE_CONTROL},
     )
 
 
@@ -163,40 +318,61 @@ def fetch_space_news(request: Request):
 
 
 @app.post("/update-missions/")
-def trigger_spacex_update(
-    background_tasks: BackgroundTasks, db: Session = Depends(get_db)
-):
+def trigger_spacex_update(background_tasks: BackgroundTasks):
     """
     Trigger a manual update for SpaceX missions.
-    Runs in the background to avoid blocking the request.
+    Runs in the background to avoid blocking the request, with its own session
+    since request-scoped sessions are closed before background tasks run. Manual
+    updates always write, regardless of when the scheduled update last ran.
     """
-    background_tasks.add_task(update_spacex_data, db)
+    background_tasks.add_task(refresh_spacex_missions, claim=False)
     return {"message": "SpaceX missions update initiated."}
 
 
-@app.get("/missions/")
+# Largest page of missions a single listing request may ask for
+MAX_PAGE_SIZE = 100
+
+
+@app.get("/missions/", response_model=schemas.MissionPage)
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-positional-arguments
 def get_missions(
     db: Session = Depends(get_db),
-    page: int = 1,
-    size: int = 10,
-    start_date: str = None,
-    end_date: str = None,
+    cursor: str = None,
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
     keyword: str = None,
+    page: int = Query(None, ge=1, deprecated=True),
 ):
     """
-    Fetch missions with pagination and optional filtering.
+    Fetch missions with cursor pagination and optional filtering.
+
+    Pass the returned `next_cursor` back as `cursor` to fetch the next page.
+    `start_date` and `end_date` are ISO-8601 datetimes, parsed once here so the
+    launch date filter binds real timestamps.
+    `page` is kept as a deprecated OFFSET-based fallback for older clients.
     """
-    missions = crud.get_filtered_missions(db, page, size, start_date, end_date, keyword)
-    return {"missions": missions, "page": page, "size": size}
+    try:
+        result = crud.get_filtered_missions(
+            db, size, start_date, end_date, keyword, cursor=cursor, page=page
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve)) from ve
+    return {
+        "missions": result["data"],
+        "next_cursor": result["next_cursor"],
+        "has_more": result["has_more"],
+        "size": size,
+    }
 
 
 @app.post("/missions/")
 def create_mission(mission: schemas.MissionCreate, db: Session = Depends(get_db)):
     """
     Create a new space mission in the database.
-    Checks if the mission already exists before creating a new one.
+    Duplicate names are rejected by the unique index on the mission name, so the
+    common case costs a single INSERT.
 
     Args:
         mission (schemas.MissionCreate): The mission data to be added.
@@ -208,29 +384,50 @@ def create_mission(mission: schemas.MissionCreate, db: Session = Depends(get_db)
     Returns:
         dict: The newly created mission object.
     """
-    # Check if mission already exists
-    existing_mission = crud.get_mission_by_name(db, mission.name)
-    if existing_mission:
-        raise HTTPException(status_code=400, detail="Mission already exists")
-
-    # New mission
-    new_mission = crud.create_mission(db=db, mission=mission)
+    try:
+        new_mission = crud.create_mission(db=db, mission=mission)
+    except IntegrityError as ie:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Mission already exists") from ie
     return new_mission
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison.
+
+    A `W/` prefix is ignored on either side, since proxies that compress the
+    response mark the tag as weak, and `*` matches any current representation.
+    """
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in tags:
+        return True
+    return etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+
 @app.get("/spacex-launches/")
-def spacex_launches():
+def spacex_launches(request: Request):
     """
     Get a list of SpaceX launches by querying an external API.
 
+    The response carries an ETag of the launches, so clients sending it back in
+    If-None-Match get an empty 304 until the data is refreshed.
+
     Returns:
         list: A list of SpaceX launches.
 
     Raises:
         HTTPException: If no SpaceX launches are found.
     """
-    launches = spacex.spacex_data
-    if launches:
-        return launches
-
-    raise HTTPException(status_code=404, detail="SpaceX launches not found!")
+    if not spacex.spacex_data:
+        raise HTTPException(status_code=404, detail="SpaceX launches not found!")
+
+    headers = {
+        "ETag": spacex.spacex_etag,
+        "Cache-Control": SPACEX_LAUNCHES_CACHE_CONTROL,
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), spacex.spacex_etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=spacex.spacex_json, media_type="application/json", headers=headers
+    )
@@ -1,13 +1,15 @@
 """
-Module for defining the Mission ORM model.
+Module for defining the ORM models.
 
 This module contains the definition of the `Mission` model, which represents
 a mission in the database. It extends from SQLAlchemy's `Base` and defines the
 structure of the "missions" table, including its columns and their types.
+It also defines `JobRun`, which records when scheduled jobs last ran.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import DDL, Column, DateTime, Index, Integer, String, event
 from .database import Base
+from .schemas import MissionSummary
 
 
 # pylint: disable=too-few-public-methods
@@ -18,20 +20,78 @@ class Mission(Base):
     The `Mission` class maps to the "missions" table in the database and
     contains the following columns:
         - id: A unique identifier for the mission (Primary Key).
-        - name: The name of the mission.
+        - name: The unique name of the mission.
         - status: The current status of the mission (e.g., active, completed).
         - description: A brief description of the mission.
+        - launch_date: The date and time the mission launched.
+
+    A composite index on (launch_date, id) backs the keyset pagination used
+    when listing missions. On PostgreSQL a trigram GIN index on name lets
+    keyword searches use an index instead of a sequential scan.
+
+    `LIST_COLUMNS` names the columns loaded for mission listings. It is taken
+    from the fields of `schemas.MissionSummary`, so the listing always loads
+    exactly what it returns.
 
     Attributes:
         id (int): The mission's unique ID.
         name (str): The name of the mission.
         status (str): The status of the mission.
         description (str): The description of the mission.
+        launch_date (datetime): The launch date of the mission.
     """
 
     __tablename__ = "missions"
 
+    LIST_COLUMNS = tuple(MissionSummary.model_fields)
+
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
     status = Column(String)
-    descritption = Column(String)
+    description = Column(String)
+    launch_date = Column(DateTime)
+
+    __table_args__ = (
+        # Listings sort undated missions first. PostgreSQL puts NULLs last by
+        # default so its index spells the order out; SQLite already sorts NULLs
+        # first and ignores the postgresql_ops option
+        Index(
+            "ix_missions_launch_date_id",
+            "launch_date",
+            "id",
+            postgresql_ops={"launch_date": "NULLS FIRST"},
+        ),
+        Index(
+            "ix_missions_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# pylint: disable=too-few-public-methods
+class JobRun(Base):
+    """
+    Records when a scheduled job last ran, shared by every worker process.
+
+    Workers claim a run by moving `last_run_at` forward in a single conditional
+    UPDATE, so only one of them runs the job per interval.
+
+    Attributes:
+        name (str): The name of the job (Primary Key).
+        last_run_at (datetime): When the most recent run was claimed, in UTC.
+    """
+
+    __tablename__ = "job_runs"
+
+    name = Column(String, primary_key=True)
+    last_run_at = Column(DateTime, nullable=False)
+
+
+# The trigram operator class must exist before the GIN index is created
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
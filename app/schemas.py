@@ -10,12 +10,14 @@ Models:
     - MissionBase: Base class for mission data validation (name, status, description).
     - MissionCreate: Model used when creating a new mission.
     - Mission: Model that includes the mission ID, used for returning mission data.
+    - MissionSummary: The subset of mission fields returned by mission listings.
+    - MissionPage: One page of missions along with its pagination cursor.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class MissionBase(BaseModel):
@@ -27,13 +29,13 @@ class MissionBase(BaseModel):
     models.
 
     Attributes:
-        name (str): The name of the mission.
-        status (str): The status of the mission.
+        name (str): The name of the mission, which must not be empty.
+        status (str): The status of the mission, which must not be empty.
         description (str): The description of the mission.
     """
 
-    name: str
-    status: str
+    name: str = Field(min_length=1)
+    status: str = Field(min_length=1)
     description: Optional[str] = "No description available."
     launch_date: Optional[datetime] = None
 
@@ -71,3 +73,46 @@ class Mission(MissionBase):
 
         # orm_mode = True
         from_attributes = True
+
+
+class MissionSummary(BaseModel):
+    """
+    Model for a mission as returned by the mission listing.
+
+    Its fields define `models.Mission.LIST_COLUMNS`, the only columns loaded
+    for listings, so each must be a column of the missions table.
+
+    Attributes:
+        id (int): The unique identifier of the mission.
+        name (str): The name of the mission.
+        status (str): The status of the mission.
+        launch_date (datetime): The launch date of the mission.
+    """
+
+    id: int
+    name: str
+    status: str
+    launch_date: Optional[datetime] = None
+
+    # pylint: disable=too-few-public-methods
+    class Config:
+        """Tell Pydantic to treat ORM models as dictionaries."""
+
+        from_attributes = True
+
+
+class MissionPage(BaseModel):
+    """
+    Model for one page of missions returned by the mission listing.
+
+    Attributes:
+        missions (List[MissionSummary]): The missions on this page.
+        next_cursor (str): The cursor to request the following page with, if any.
+        has_more (bool): Whether more missions follow this page.
+        size (int): The requested page size.
+    """
+
+    missions: List[MissionSummary]
+    next_cursor: Optional[str] = None
+    has_more: bool
+    size: int
@@ -0,0 +1,59 @@
+"""
+Alembic environment for the Space Nomad database.
+
+Migrations run against the same database the app uses, configured through
+`app.database.DATABASE_URL`, and compare against the ORM models' metadata.
+"""
+
+# pylint: disable=no-member
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from app import models
+from app.database import DATABASE_URL
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = models.Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """
+    Emit the migration SQL to stdout without connecting to the database.
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Run the migrations against a live database connection.
+    """
+    engine = create_engine(DATABASE_URL)
+    with engine.connect() as connection:
+        # SQLite can't alter columns in place, so alter through table copies
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=True,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
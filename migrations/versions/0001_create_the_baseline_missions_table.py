@@ -0,0 +1,48 @@
+"""Create the baseline missions table
+
+Databases created before migrations were introduced already have this table,
+so it is only created when missing and those databases are adopted as-is.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 22:29:28.241671
+
+"""
+
+# pylint: disable=invalid-name,no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Offline (--sql) runs can't inspect the database and always emit the table
+    if not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table("missions"):
+        return
+
+    op.create_table(
+        "missions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("descritption", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_missions_id", "missions", ["id"])
+    op.create_index("ix_missions_name", "missions", ["name"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_missions_name", table_name="missions")
+    op.drop_index("ix_missions_id", table_name="missions")
+    op.drop_table("missions")
@@ -0,0 +1,63 @@
+"""Add launch dates and unique mission names
+
+Adds the launch_date column and the (launch_date, id) index used for keyset
+pagination, fixes the misspelt descritption column, and makes mission names
+required and unique so SpaceX missions can be upserted on name.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 22:29:28.643114
+
+"""
+
+# pylint: disable=invalid-name,no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Unnamed or duplicated missions can't satisfy the new constraints; keep
+    # the most recently added row for each name
+    op.execute("DELETE FROM missions WHERE name IS NULL")
+    op.execute(
+        "DELETE FROM missions WHERE id NOT IN "
+        "(SELECT MAX(id) FROM missions GROUP BY name)"
+    )
+
+    op.drop_index("ix_missions_name", table_name="missions")
+    with op.batch_alter_table("missions") as batch_op:
+        batch_op.alter_column(
+            "descritption", new_column_name="description", existing_type=sa.String()
+        )
+        batch_op.alter_column("name", existing_type=sa.String(), nullable=False)
+        batch_op.add_column(sa.Column("launch_date", sa.DateTime(), nullable=True))
+    op.create_index("ix_missions_name", "missions", ["name"], unique=True)
+    op.create_index(
+        "ix_missions_launch_date_id",
+        "missions",
+        ["launch_date", "id"],
+        postgresql_ops={"launch_date": "NULLS FIRST"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_missions_launch_date_id", table_name="missions")
+    op.drop_index("ix_missions_name", table_name="missions")
+    with op.batch_alter_table("missions") as batch_op:
+        batch_op.drop_column("launch_date")
+        batch_op.alter_column("name", existing_type=sa.String(), nullable=True)
+        batch_op.alter_column(
+            "description", new_column_name="descritption", existing_type=sa.String()
+        )
+    op.create_index("ix_missions_name", "missions", ["name"])
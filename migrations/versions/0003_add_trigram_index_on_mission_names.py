@@ -0,0 +1,47 @@
+"""Add trigram index on mission names
+
+Lets PostgreSQL serve the ILIKE keyword search on mission names from a GIN
+index instead of a sequential scan. Other databases have no pg_trgm, so this
+revision does nothing on them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 22:32:17.201574
+
+"""
+
+# pylint: disable=invalid-name,no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_missions_name_trgm",
+        "missions",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # pg_trgm is left installed since other objects may depend on it
+    op.drop_index("ix_missions_name_trgm", table_name="missions")
@@ -0,0 +1,38 @@
+"""Add job runs table
+
+Records when scheduled jobs last ran so that only one worker process runs
+each job per interval.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 22:33:25.746436
+
+"""
+
+# pylint: disable=invalid-name,no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_runs",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("job_runs")
@@ -0,0 +1,184 @@
+"""
+Shared fixtures for the Space Nomad test suite.
+
+Each test runs against a fresh in-memory SQLite database built from the ORM
+models, with Redis disabled, and without the startup events that fetch SpaceX
+data and start the scheduler.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+import redis
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import crud, database, main, models
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(monkeypatch):
+    """
+    Point the app at an empty in-memory database for the duration of a test.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    models.Base.metadata.create_all(engine)
+    monkeypatch.setattr(
+        database,
+        "SessionLocal",
+        sessionmaker(autocommit=False, autoflush=False, bind=engine),
+    )
+    monkeypatch.setattr(crud, "redis_client", None)
+    monkeypatch.setattr(main, "_stats_cache", {"counts": {}, "expires_at": 0.0})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="db")
+def fixture_db(engine):  # pylint: disable=unused-argument
+    """
+    A session on the test database, for seeding data and calling crud directly.
+    """
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(name="client")
+def fixture_client(engine):  # pylint: disable=unused-argument
+    """
+    A test client for the app. Startup events are not run.
+    """
+    return TestClient(main.app)
+
+
+@pytest.fixture(name="assert_max_queries")
+def fixture_assert_max_queries(engine):
+    """
+    Assert that a block of code sends at most `limit` statements to the database.
+
+    Usage:
+        with assert_max_queries(2):
+            client.get("/missions/")
+    """
+
+    @contextmanager
+    def check(limit):
+        statements = []
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert len(statements) <= limit, "\n\n".join(statements)
+
+    return check
+
+
+class FakePipeline:
+    """
+    The subset of a redis-py transactional pipeline used by the app.
+
+    WATCHed keys are checked at execute(), which raises WatchError if any of
+    them was written since watch() was called.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.watched = {}
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.reset()
+
+    def reset(self):
+        """Forget watched keys and queued commands."""
+        self.watched = {}
+        self.commands = []
+
+    def watch(self, *keys):
+        """Remember the version of each key."""
+        self.watched = {key: self.client.versions.get(key, 0) for key in keys}
+
+    def multi(self):
+        """Start queueing commands."""
+        self.commands = []
+
+    def mset(self, mapping):
+        """Queue an MSET."""
+        self.commands.append(lambda: self.client.mset(mapping))
+
+    def execute(self):
+        """Run the queued commands unless a watched key changed."""
+        changed = any(
+            self.client.versions.get(key, 0) != version
+            for key, version in self.watched.items()
+        )
+        try:
+            if changed:
+                raise redis.WatchError("Watched variable changed.")
+            return [command() for command in self.commands]
+        finally:
+            self.reset()
+
+
+class FakeRedis:
+    """
+    An in-memory stand-in for the redis-py client, covering the calls the app makes.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}
+
+    def _touch(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def mget(self, keys):
+        """Return the value of each key, or None if missing."""
+        return [self.data.get(key) for key in keys]
+
+    def mset(self, mapping):
+        """Set several keys at once."""
+        for key, value in mapping.items():
+            self.data[key] = str(value).encode()
+            self._touch(key)
+        return True
+
+    def delete(self, *keys):
+        """Delete keys, returning how many existed."""
+        deleted = 0
+        for key in keys:
+            if self.data.pop(key, None) is not None:
+                deleted += 1
+            self._touch(key)
+        return deleted
+
+    def pipeline(self, transaction=True):  # pylint: disable=unused-argument
+        """Return a transactional pipeline."""
+        return FakePipeline(self)
+
+
+@pytest.fixture(name="fake_redis")
+def fixture_fake_redis(engine, monkeypatch):  # pylint: disable=unused-argument
+    """
+    Give the app an in-memory Redis client in place of the disabled one.
+    """
+    client = FakeRedis()
+    monkeypatch.setattr(crud, "redis_client", client)
+    return client
@@ -0,0 +1,59 @@
+"""
+Tests for the HTTP caching headers and conditional requests.
+"""
+
+import pytest
+
+from app import main
+from app.api import spacex
+
+ETAG = '"0123456789abcdef"'
+
+
+@pytest.fixture(name="launches")
+def fixture_launches(monkeypatch):
+    """
+    Serve a fixed set of launches without calling the SpaceX API.
+    """
+    monkeypatch.setattr(spacex, "spacex_data", [{"name": "FalconSat"}])
+    monkeypatch.setattr(spacex, "spacex_json", b'[{"name": "FalconSat"}]')
+    monkeypatch.setattr(spacex, "spacex_etag", ETAG)
+
+
+@pytest.mark.usefixtures("launches")
+def test_launches_carry_etag_and_cache_control(client):
+    """A plain request gets the launches with their ETag."""
+    response = client.get("/spacex-launches/")
+    assert response.status_code == 200
+    assert response.json() == [{"name": "FalconSat"}]
+    assert response.headers["etag"] == ETAG
+    assert response.headers["cache-control"] == main.SPACEX_LAUNCHES_CACHE_CONTROL
+
+
+@pytest.mark.usefixtures("launches")
+@pytest.mark.parametrize(
+    "if_none_match",
+    [ETAG, f"W/{ETAG}", f'"stale", {ETAG}', f'"stale", W/{ETAG}', "*"],
+)
+def test_matching_etag_is_not_modified(client, if_none_match):
+    """Strong, weak, listed and wildcard matches all get an empty 304."""
+    response = client.get("/spacex-launches/", headers={"If-None-Match": if_none_match})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == ETAG
+
+
+@pytest.mark.usefixtures("launches")
+@pytest.mark.parametrize("if_none_match", ['"stale"', 'W/"stale"', ETAG.strip('"')])
+def test_stale_etag_gets_the_launches(client, if_none_match):
+    """A tag that doesn't match gets the full response."""
+    response = client.get("/spacex-launches/", headers={"If-None-Match": if_none_match})
+    assert response.status_code == 200
+    assert response.json() == [{"name": "FalconSat"}]
+
+
+def test_home_page_is_private(client):
+    """The home page may only be cached by the visitor's own browser."""
+    response = client.get("/index")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, max-age=60"
@@ -0,0 +1,148 @@
+"""
+Tests for the crud helpers that don't go through an endpoint.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import crud, main, models, schemas
+from app.crud import MISSION_COUNTER_KEYS
+
+HOUR = timedelta(hours=1)
+
+
+def _stored_counts(fake_redis):
+    values = fake_redis.mget(list(MISSION_COUNTER_KEYS.values()))
+    return {key: int(value) for key, value in zip(MISSION_COUNTER_KEYS, values)}
+
+
+def test_counters_are_rebuilt_after_create(db, fake_redis):
+    """Creating a mission resets the counters and the next read counts it."""
+    crud.create_mission(db, schemas.MissionCreate(name="Gemini 4", status="Completed"))
+    assert crud.get_mission_counters(db) == {"total": 1, "completed": 1, "ongoing": 0}
+
+    crud.create_mission(db, schemas.MissionCreate(name="Crew-9", status="Ongoing"))
+    assert fake_redis.mget(list(MISSION_COUNTER_KEYS.values())) == [None] * 3
+
+    assert crud.get_mission_counters(db) == {"total": 2, "completed": 1, "ongoing": 1}
+    assert _stored_counts(fake_redis) == {"total": 2, "completed": 1, "ongoing": 1}
+
+
+def test_refresh_retries_when_a_mission_is_created_during_the_recount(
+    db, fake_redis, monkeypatch
+):
+    """A create landing between WATCH and EXEC makes the refresh count again."""
+    count_status = crud.get_mission_status_counts
+    calls = []
+
+    def count_then_create(session):
+        counts = count_status(session)
+        if not calls:
+            crud.create_mission(
+                db, schemas.MissionCreate(name="Crew-9", status="Ongoing")
+            )
+        calls.append(counts)
+        return counts
+
+    monkeypatch.setattr(crud, "get_mission_status_counts", count_then_create)
+
+    assert crud.refresh_mission_counters(db) == {
+        "total": 1,
+        "completed": 0,
+        "ongoing": 1,
+    }
+    assert len(calls) == 2
+    assert _stored_counts(fake_redis) == {"total": 1, "completed": 0, "ongoing": 1}
+
+
+def test_refresh_after_create_does_not_double_count(db, fake_redis):
+    """A refresh that already counted a new mission isn't topped up again."""
+    crud.create_mission(db, schemas.MissionCreate(name="Gemini 4", status="Completed"))
+    crud.refresh_mission_counters(db)
+    crud.create_mission(db, schemas.MissionCreate(name="Crew-9", status="Ongoing"))
+    crud.refresh_mission_counters(db)
+
+    assert crud.get_mission_counters(db) == {"total": 2, "completed": 1, "ongoing": 1}
+    assert _stored_counts(fake_redis) == {"total": 2, "completed": 1, "ongoing": 1}
+
+
+def test_counters_without_redis(db):
+    """Without Redis the counters are unavailable and writes still succeed."""
+    crud.create_mission(db, schemas.MissionCreate(name="Gemini 4", status="Completed"))
+    assert crud.get_mission_counters(db) is None
+    assert crud.refresh_mission_counters(db) is None
+
+
+def _last_run_at(db, name):
+    db.expire_all()
+    return db.get(models.JobRun, name).last_run_at
+
+
+def test_first_claim_inserts_the_job_run(db):
+    """The first claim of a job records its run."""
+    claimed_at = crud.claim_job_run(db, "job", HOUR)
+    assert claimed_at is not None
+    assert _last_run_at(db, "job") == claimed_at
+
+
+def test_claim_within_interval_is_refused(db):
+    """A second claim before `min_interval` has passed doesn't run the job."""
+    claimed_at = crud.claim_job_run(db, "job", HOUR)
+    assert crud.claim_job_run(db, "job", HOUR) is None
+    assert _last_run_at(db, "job") == claimed_at
+
+
+def test_claim_after_interval_succeeds(db):
+    """Once `min_interval` has passed since the last run, the job can run again."""
+    first = crud.claim_job_run(db, "job", HOUR)
+    job_run = db.get(models.JobRun, "job")
+    job_run.last_run_at = first - HOUR
+    db.commit()
+
+    second = crud.claim_job_run(db, "job", HOUR)
+    assert second is not None and second >= first
+    assert _last_run_at(db, "job") == second
+
+
+def test_claims_are_per_job(db):
+    """Claiming one job doesn't hold up another."""
+    assert crud.claim_job_run(db, "job", HOUR) is not None
+    assert crud.claim_job_run(db, "other job", HOUR) is not None
+
+
+def test_released_claim_can_be_claimed_again(db):
+    """Releasing a claim lets the next attempt run without waiting."""
+    claimed_at = crud.claim_job_run(db, "job", HOUR)
+    crud.release_job_run(db, "job", claimed_at, HOUR)
+    assert crud.claim_job_run(db, "job", HOUR) is not None
+
+
+def test_release_leaves_a_newer_claim_alone(db):
+    """A stale release doesn't undo a claim made after it."""
+    first = crud.claim_job_run(db, "job", HOUR)
+    db.get(models.JobRun, "job").last_run_at = first - HOUR
+    db.commit()
+    second = crud.claim_job_run(db, "job", HOUR)
+
+    crud.release_job_run(db, "job", first, HOUR)
+    assert _last_run_at(db, "job") == second
+
+
+def test_failed_spacex_update_releases_its_claim(db, monkeypatch):
+    """A failed upsert gives the interval back instead of skipping it."""
+
+    async def fetch_spacex_data():
+        return [{"mission_name": "FalconSat", "launch_success": False}]
+
+    def bulk_upsert_missions(session, missions):
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(main.spacex, "fetch_spacex_data", fetch_spacex_data)
+    monkeypatch.setattr(crud, "bulk_upsert_missions", bulk_upsert_missions)
+
+    with pytest.raises(OperationalError):
+        asyncio.run(main.update_spacex_data(db))
+    assert crud.claim_job_run(db, main.SPACEX_UPDATE_JOB, main.SPACEX_UPDATE_MIN_GAP)
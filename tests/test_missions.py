@@ -0,0 +1,205 @@
+"""
+Tests for listing, creating and counting missions.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app import crud, main, models, schemas
+
+
+@pytest.fixture(name="missions")
+def fixture_missions(db):
+    """
+    Seed undated missions followed by dated ones, in a scrambled insert order.
+    """
+    rows = [
+        models.Mission(name="Undated 1", status="Ongoing"),
+        models.Mission(
+            name="Apollo 11", status="Completed", launch_date=datetime(1969, 7, 16)
+        ),
+        models.Mission(name="Undated 2", status="Ongoing"),
+        models.Mission(
+            name="Crew-1", status="Completed", launch_date=datetime(2020, 11, 16)
+        ),
+        models.Mission(
+            name="Artemis I", status="Completed", launch_date=datetime(2022, 11, 16)
+        ),
+        models.Mission(name="Undated 3", status="Planned"),
+        models.Mission(
+            name="Gemini 4", status="Completed", launch_date=datetime(1965, 6, 3)
+        ),
+    ]
+    db.add_all(rows)
+    db.commit()
+    return [
+        "Undated 1",
+        "Undated 2",
+        "Undated 3",
+        "Gemini 4",
+        "Apollo 11",
+        "Crew-1",
+        "Artemis I",
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 10])
+def test_cursor_pages_cover_every_mission_once(client, missions, size):
+    """Following next_cursor walks every mission once, undated ones first."""
+    names = []
+    params = {"size": size}
+    while True:
+        response = client.get("/missions/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["missions"]) <= size
+        names += [mission["name"] for mission in page["missions"]]
+        if not page["has_more"]:
+            assert page["next_cursor"] is None
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert names == missions
+
+
+def test_cursor_round_trip():
+    """A cursor decodes back to the launch date and ID it was built from."""
+    for launch_date in (datetime(2020, 11, 16, 0, 27), None):
+        cursor = crud.encode_cursor(launch_date, 42)
+        assert crud.decode_cursor(cursor) == (launch_date, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "WzFd"])
+def test_invalid_cursor_is_rejected(client, cursor):
+    """Malformed cursors are a client error, not a server error."""
+    response = client.get("/missions/", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("size", [0, -1, 101])
+def test_page_size_is_bounded(client, size):
+    """Page sizes outside 1..MAX_PAGE_SIZE are rejected."""
+    response = client.get("/missions/", params={"size": size})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("page", [0, -3])
+def test_deprecated_page_is_bounded(client, page):
+    """Pages before the first are rejected instead of becoming a negative OFFSET."""
+    response = client.get("/missions/", params={"page": page})
+    assert response.status_code == 422
+
+
+def test_deprecated_page_parameter(client, missions):
+    """The OFFSET-based page parameter still returns the right slice."""
+    response = client.get("/missions/", params={"size": 2, "page": 2})
+    assert [m["name"] for m in response.json()["missions"]] == missions[2:4]
+
+
+def test_listing_filters(client, missions):
+    """Keyword and launch date filters narrow the listing."""
+    response = client.get("/missions/", params={"keyword": "undated"})
+    assert [m["name"] for m in response.json()["missions"]] == missions[:3]
+
+    response = client.get(
+        "/missions/",
+        params={"start_date": "1969-01-01T00:00:00", "end_date": "2021-01-01"},
+    )
+    assert [m["name"] for m in response.json()["missions"]] == missions[4:6]
+
+
+def test_listing_loads_only_listed_columns(db, missions):
+    """Unlisted columns raise instead of being lazily loaded per row."""
+    page = crud.get_filtered_missions(db, 10, None, None, None)
+    assert [m.name for m in page["data"]] == missions
+    with pytest.raises(InvalidRequestError):
+        _ = page["data"][0].description
+
+
+def test_list_columns_match_the_summary_schema():
+    """Listings load exactly the mission columns the summary schema returns."""
+    assert models.Mission.LIST_COLUMNS == tuple(schemas.MissionSummary.model_fields)
+    assert set(models.Mission.LIST_COLUMNS) <= set(
+        models.Mission.__table__.columns.keys()
+    )
+
+
+@pytest.mark.parametrize("size", [2, 3, 4])
+@pytest.mark.usefixtures("missions")
+def test_listing_query_count(client, assert_max_queries, size):
+    """Every listing page, including ones crossing into dated missions, takes <= 2 queries."""
+    params = {"size": size}
+    while True:
+        with assert_max_queries(2):
+            page = client.get("/missions/", params=params).json()
+        if not page["has_more"]:
+            break
+        params["cursor"] = page["next_cursor"]
+
+
+@pytest.mark.usefixtures("missions")
+def test_home_page_stats(client, assert_max_queries):
+    """The home page counts missions with a single aggregate query."""
+    with assert_max_queries(2):
+        response = client.get("/index")
+    assert response.status_code == 200
+    assert "Total Missions: 7" in response.text
+    assert "Completed Missions: 4" in response.text
+    assert "Ongoing Missions: 2" in response.text
+
+
+def test_create_mission(client, assert_max_queries):
+    """Missions are created in one round-trip and duplicate names are rejected."""
+    mission = {"name": "Starlink 1", "status": "Ongoing"}
+    with assert_max_queries(2):
+        response = client.post("/missions/", json=mission)
+    assert response.status_code == 200
+    assert response.json()["name"] == "Starlink 1"
+
+    with assert_max_queries(2):
+        response = client.post("/missions/", json=mission)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "mission", [{"name": "", "status": "Ongoing"}, {"name": "Crew-9", "status": ""}]
+)
+def test_create_mission_requires_name_and_status(client, mission):
+    """Empty names and statuses are rejected before reaching the database."""
+    response = client.post("/missions/", json=mission)
+    assert response.status_code == 422
+
+
+def test_validate_missions_drops_invalid_ones():
+    """Invalid SpaceX missions are skipped and the rest of the batch is kept."""
+    missions = [
+        {"name": "FalconSat", "status": "Failure", "description": "first"},
+        {"name": "", "status": "Success"},
+        {"name": "DemoSat", "status": None},
+        {"name": "Trailblazer", "status": "Failure"},
+    ]
+    assert main.validate_missions(missions) == [
+        {"name": "FalconSat", "status": "Failure", "description": "first"},
+        {"name": "Trailblazer", "status": "Failure"},
+    ]
+
+
+def test_bulk_upsert_missions(db):
+    """Upserting inserts new missions and updates existing ones by name."""
+    crud.bulk_upsert_missions(
+        db,
+        [
+            {"name": "CRS-1", "status": "Success", "description": "first"},
+            {"name": "CRS-2", "status": "Success", "description": "second"},
+        ],
+    )
+    crud.bulk_upsert_missions(
+        db, [{"name": "CRS-2", "status": "Failure", "description": "updated"}]
+    )
+
+    missions = {m.name: m for m in db.query(models.Mission)}
+    assert set(missions) == {"CRS-1", "CRS-2"}
+    assert missions["CRS-2"].status == "Failure"
+    assert missions["CRS-2"].description == "updated"